@@ -3,8 +3,23 @@ Simple XML Parser for CGMES Analysis
 No rdflib required, uses only xml.etree
 """
 
-import xml.etree.ElementTree as ET
+# lxml's C parser is many times faster than the pure-Python ElementTree
+# and uses less memory; fall back to the stdlib when it is not installed
+try:
+    from lxml import etree as ET
+    USING_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    USING_LXML = False
+# numpy is optional: the numeric validation kernels in question 6 vectorize
+# when it is available and fall back to plain Python loops otherwise
+try:
+    import numpy as np
+except ImportError:
+    np = None
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import sys
 import io
 
@@ -20,360 +35,554 @@ NAMESPACES = {
     'md': 'http://iec.ch/TC57/61970-552/ModelDescription/1#'
 }
 
+# Braced namespace prefixes precomputed once - fully qualified tags need no
+# namespace map at find() time (works identically in lxml and stdlib ET)
+NS_PREFIX = {prefix: '{' + uri + '}' for prefix, uri in NAMESPACES.items()}
+
+# The only CIM object types the analyses actually consume. Everything else
+# is cleared as soon as its end tag is seen, so memory stays proportional
+# to the interesting objects rather than the whole file
+KEEP = frozenset((
+    'GeneratingUnit', 'SynchronousMachine', 'RegulatingControl',
+    'PowerTransformer', 'PowerTransformerEnd', 'Terminal',
+    'ACLineSegment', 'OperationalLimitSet', 'CurrentLimit',
+    'OperationalLimitType', 'VoltageLevel', 'BaseVoltage',
+    'EquivalentInjection',
+))
+
+def _compile_keep_dispatch():
+    """
+    Generate the bucket dispatch for the fixed KEEP set at import time:
+    an if/elif chain of identity comparisons against the interned
+    localnames, specialized once instead of interpreted per element.
+    classify_tag() returns interned localnames, so 'is' suffices.
+    """
+    names = sorted(KEEP)
+    consts = {f'_T{i}': sys.intern(name) for i, name in enumerate(names)}
+    src = ['def keep_bucket(local, elem, buckets):']
+    branch = 'if'
+    for i in range(len(names)):
+        src.append(f'    {branch} local is _T{i}:')
+        src.append(f'        buckets[_T{i}].append(elem)')
+        src.append('        return True')
+        branch = 'elif'
+    src.append('    return False')
+    namespace = dict(consts)
+    exec('\n'.join(src), namespace)
+    return namespace['keep_bucket']
+
+keep_bucket = _compile_keep_dispatch()
+
+# Tag classification sentinels for the parse loop
+_PROPERTY = object()     # cim:Type.property child
+_LNAME = object()        # the IdentifiedObject.lname typo tag
+_FOREIGN = object()      # non-cim namespace (md:FullModel etc.)
+
+@lru_cache(maxsize=None)
+def classify_tag(tag):
+    """
+    Interned object localname for cim: object tags, or a sentinel for
+    property / typo / foreign tags. Expat and lxml both reuse one string
+    object per distinct tag, so after the first sighting this is a cached
+    pointer-hash hit instead of a prefix scan and slice per element.
+    """
+    cim_ns = NS_PREFIX['cim']
+    if tag.startswith(cim_ns):
+        local = tag[len(cim_ns):]
+        if '.' not in local:
+            return sys.intern(local)
+        if local == 'IdentifiedObject.lname':
+            return _LNAME
+        return _PROPERTY
+    return _FOREIGN
+
 def parse_cgmes_file(file_path):
-    """Parse XML file"""
+    """
+    Stream the XML with iterparse instead of materializing a DOM and then
+    walking it once per tag name. CGMES EQ files are flat containers of CIM
+    objects, so a single pass partitions every interesting object element
+    into a per-type bucket and drops everything else immediately. mRID
+    bookkeeping (owner types for the duplicate check, UUID shape of mRID
+    text and rdf:ID attributes) happens here, before elements are cleared,
+    so the question 6 checks still cover every object type. Malformed XML
+    aborts the parse with the parser's own error; a stray
+    IdentifiedObject.lname typo tag is recorded as a structure issue.
+    """
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        buckets = defaultdict(list)
+        mrid_owners = defaultdict(list)
+        structure_issues = []
+        root = None
+        for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                continue
+            tag = elem.tag
+            if not isinstance(tag, str):
+                continue
+            # Most end events are property children - dispatch on the cached
+            # classification, cheapest case first
+            local = classify_tag(tag)
+            if local is _PROPERTY:
+                pass
+            elif local is _FOREIGN:
+                if elem is not root:
+                    elem.clear()
+            elif local is _LNAME:
+                structure_issues.append("XML TYPO ERROR: Found '<lname>' tag, should be '<name>'")
+            else:
+                # local is the interned object localname
+                mrid = get_element_text(elem, 'IdentifiedObject.mRID')
+                if mrid:
+                    # Owner bookkeeping doubles as the duplicate-mRID check
+                    mrid_owners[mrid].append(local)
+                    if len(mrid) != 36 or mrid.count('-') != 4:
+                        structure_issues.append(f"INCOMPLETE mRID: {mrid} (length {len(mrid)}, expected 36)")
+                # The rdf:ID attribute carries the same UUID (with a
+                # leading '_') and can be truncated independently
+                rdf_id = elem.attrib.get(RDF_ID)
+                if rdf_id:
+                    uuid = rdf_id.lstrip('_')
+                    if len(uuid) != 36 or uuid.count('-') != 4:
+                        structure_issues.append(f"INCOMPLETE mRID: {uuid} (length {len(uuid)}, expected 36)")
+                if not keep_bucket(local, elem, buckets):
+                    elem.clear()
+            if USING_LXML and elem is not root and elem.getparent() is root:
+                # lxml keeps cleared shells chained under the root; dropping
+                # completed siblings keeps the live window O(active element).
+                # Bucketed elements stay fully usable once detached
+                while elem.getprevious() is not None:
+                    del root[0]
+        if root is not None:
+            # Detach the remaining children so the buckets hold the only
+            # references to the CIM objects
+            root.clear()
         print(f"✓ File loaded: {file_path}")
-        return tree, root
+        return buckets, mrid_owners, structure_issues
     except Exception as e:
+        # Covers unclosed tags and other well-formedness errors: the parser
+        # reports them directly, no substring sniffing over the raw file
         print(f"✗ Error: {e}")
-        return None, None
+        return None, None, None
+
+# The rdf attribute keys, interned once: expat interns the names it hands
+# out, so attrib lookups and tag comparisons against these short-circuit
+# on pointer identity instead of comparing 50+ character URIs
+RDF_RESOURCE = sys.intern(NS_PREFIX['rdf'] + 'resource')
+RDF_ID = sys.intern(NS_PREFIX['rdf'] + 'ID')
 
-def get_element_text(element, tag_name, ns='cim'):
+def suffix(ref, sep='#_'):
+    """Suffix of a URI reference after sep, without split's list allocation"""
+    return ref.rpartition(sep)[2] if ref else ''
+
+@lru_cache(maxsize=None)
+def cim_tag(tag_name):
+    """Fully qualified cim: tag string, built and interned once per name"""
+    return sys.intern(NS_PREFIX['cim'] + tag_name)
+
+def get_element_text(element, tag_name):
     """Get tag value from element"""
-    full_tag = f"{{{NAMESPACES[ns]}}}{tag_name}"
-    child = element.find(full_tag, NAMESPACES)
+    child = element.find(cim_tag(tag_name))
     return child.text if child is not None else None
 
-def get_element_resource(element, tag_name, ns='cim'):
+def get_element_resource(element, tag_name):
     """Get resource reference from element"""
-    full_tag = f"{{{NAMESPACES[ns]}}}{tag_name}"
-    child = element.find(full_tag, NAMESPACES)
+    child = element.find(cim_tag(tag_name))
     if child is not None:
-        return child.get(f"{{{NAMESPACES['rdf']}}}resource")
+        # .attrib.get skips Element.get's default-argument path
+        return child.attrib.get(RDF_RESOURCE)
     return None
 
-def analyze_question_1(root):
+# Schema-numeric properties, parsed to float once at index-build time so the
+# analyses never re-run float() on the same text node (normalValue alone was
+# re-parsed in questions 4 and 6, maxOperatingP in 1 and 5)
+NUMERIC_TAGS = {
+    'GeneratingUnit': ('GeneratingUnit.maxOperatingP', 'GeneratingUnit.nominalP'),
+    'SynchronousMachine': ('RotatingMachine.ratedPowerFactor', 'RotatingMachine.ratedS'),
+    'PowerTransformerEnd': ('PowerTransformerEnd.ratedU', 'PowerTransformerEnd.ratedS'),
+    'CurrentLimit': ('CurrentLimit.normalValue',),
+    'BaseVoltage': ('BaseVoltage.nominalVoltage',),
+    'EquivalentInjection': ('EquivalentInjection.r', 'EquivalentInjection.x'),
+}
+
+def get_element_float(idx, element, tag_name):
+    """Pre-parsed numeric property value, or None if the tag was absent"""
+    return idx['numeric'].get((id(element), tag_name))
+
+def build_index(buckets, mrid_owners, structure_issues):
+    """
+    Index the pre-partitioned CIM objects by type and mRID, plus
+    reverse-reference maps for the hot lookups (limits per limit set,
+    limit sets per terminal, terminals per equipment, winding ends per
+    transformer). Turns the repeated tree scans in the analyses into
+    O(1) dict lookups. The mRID owner map and structure issues were
+    already collected during the parse pass (they must cover object
+    types whose elements are no longer retained).
+    """
+    by_type = defaultdict(dict)            # localname -> {mrid: element}
+    by_mrid = {}                           # mrid -> element, across all types
+    names_by_type = defaultdict(dict)      # localname -> {name: element}
+    ends_by_transformer = defaultdict(list)
+    terminals_by_equipment = defaultdict(list)
+    sets_by_terminal = defaultdict(list)
+    limits_by_set = defaultdict(list)
+    numeric = {}                           # (id(element), tag) -> float
+
+    for local, elements in buckets.items():
+        numeric_tags = NUMERIC_TAGS.get(local, ())
+        for el in elements:
+            mrid = get_element_text(el, 'IdentifiedObject.mRID')
+            if mrid:
+                by_type[local][mrid] = el
+                by_mrid[mrid] = el
+            name = get_element_text(el, 'IdentifiedObject.name')
+            if name:
+                names_by_type[local][name] = el
+            for tag in numeric_tags:
+                text = get_element_text(el, tag)
+                if text:
+                    numeric[(id(el), tag)] = float(text)
+
+        # Reverse references, keyed by the #_<uuid> suffix
+        if local == 'PowerTransformerEnd':
+            for el in elements:
+                ref = get_element_resource(el, 'PowerTransformerEnd.PowerTransformer')
+                if ref:
+                    ends_by_transformer[suffix(ref)].append(el)
+        elif local == 'Terminal':
+            for el in elements:
+                ref = get_element_resource(el, 'Terminal.ConductingEquipment')
+                if ref:
+                    terminals_by_equipment[suffix(ref)].append(el)
+        elif local == 'OperationalLimitSet':
+            for el in elements:
+                ref = get_element_resource(el, 'OperationalLimitSet.Terminal')
+                if ref:
+                    sets_by_terminal[suffix(ref)].append(el)
+        elif local == 'CurrentLimit':
+            for el in elements:
+                ref = get_element_resource(el, 'OperationalLimit.OperationalLimitSet')
+                if ref:
+                    limits_by_set[suffix(ref)].append(el)
+
+    return {
+        'by_type': by_type,
+        'by_mrid': by_mrid,
+        'names_by_type': names_by_type,
+        'mrid_owners': mrid_owners,
+        'structure_issues': structure_issues,
+        'numeric': numeric,
+        'elements_by_type': buckets,
+        'ends_by_transformer': ends_by_transformer,
+        'terminals_by_equipment': terminals_by_equipment,
+        'sets_by_terminal': sets_by_terminal,
+        'limits_by_set': limits_by_set,
+    }
+
+def resolve(idx, ref):
+    """Resolve a '...#_<uuid>' rdf:resource reference to its element"""
+    if not ref:
+        return None
+    return idx['by_mrid'].get(suffix(ref))
+
+def analyze_question_1(idx, out):
     """Question 1: Generator capacity and power factor"""
-    print("\n" + "="*80)
-    print("1. GENERATOR CAPACITY AND POWER FACTORS")
-    print("="*80)
-    
-    # Find GeneratingUnits
-    gen_units = {}
-    total_capacity = 0
-    
-    for gen_unit in root.findall('.//cim:GeneratingUnit', NAMESPACES):
+    out.append("\n" + "="*80)
+    out.append("1. GENERATOR CAPACITY AND POWER FACTORS")
+    out.append("="*80)
+    
+    # Columnar layout: one list per attribute instead of a dict per unit.
+    # The numeric columns vectorize with numpy when it is installed
+    names = []
+    max_p_col = []
+    nominal_p_col = []
+    index_of = {}                           # mrid -> row number
+
+    for gen_unit in idx['elements_by_type']['GeneratingUnit']:
         mrid = get_element_text(gen_unit, 'IdentifiedObject.mRID')
         name = get_element_text(gen_unit, 'IdentifiedObject.name')
-        max_p = get_element_text(gen_unit, 'GeneratingUnit.maxOperatingP')
-        min_p = get_element_text(gen_unit, 'GeneratingUnit.minOperatingP')
-        nominal_p = get_element_text(gen_unit, 'GeneratingUnit.nominalP')
-        
-        if max_p:
-            gen_units[mrid] = {
-                'name': name,
-                'max_p': float(max_p),
-                'min_p': float(min_p) if min_p else 0,
-                'nominal_p': float(nominal_p) if nominal_p else 0
-            }
-            total_capacity += float(max_p)
-    
+        max_p = get_element_float(idx, gen_unit, 'GeneratingUnit.maxOperatingP')
+        nominal_p = get_element_float(idx, gen_unit, 'GeneratingUnit.nominalP')
+
+        if max_p is not None:
+            index_of[mrid] = len(names)
+            names.append(name)
+            max_p_col.append(max_p)
+            nominal_p_col.append(nominal_p if nominal_p is not None else 0)
+
+    n = len(names)
+    pf_col = [None] * n
+    rated_s_col = [None] * n
+
     # Find SynchronousMachines and add power factor
-    for sync_machine in root.findall('.//cim:SynchronousMachine', NAMESPACES):
+    for sync_machine in idx['elements_by_type']['SynchronousMachine']:
         gen_unit_ref = get_element_resource(sync_machine, 'RotatingMachine.GeneratingUnit')
-        pf = get_element_text(sync_machine, 'RotatingMachine.ratedPowerFactor')
-        rated_s = get_element_text(sync_machine, 'RotatingMachine.ratedS')
-        
+
         if gen_unit_ref:
-            gen_unit_id = gen_unit_ref.split('#_')[-1]
-            if gen_unit_id in gen_units:
-                gen_units[gen_unit_id]['power_factor'] = float(pf) if pf else None
-                gen_units[gen_unit_id]['rated_s'] = float(rated_s) if rated_s else None
-    
-    print(f"\nTotal Generation Capacity: {total_capacity} MW\n")
-    print(f"{'Unit':<25} {'Max P (MW)':<12} {'Nominal P':<12} {'Power Factor':<12} {'Rated S (MVA)':<15}")
-    print("-" * 80)
-    
-    for gen_id, data in gen_units.items():
-        pf = data.get('power_factor', 'N/A')
-        rated_s = data.get('rated_s', 'N/A')
-        print(f"{data['name']:<25} {data['max_p']:<12.1f} {data['nominal_p']:<12.1f} "
-              f"{pf if pf == 'N/A' else f'{pf:.2f}':<12} {rated_s if rated_s == 'N/A' else f'{rated_s:.1f}':<15}")
+            row = index_of.get(suffix(gen_unit_ref))
+            if row is not None:
+                pf_col[row] = get_element_float(idx, sync_machine, 'RotatingMachine.ratedPowerFactor')
+                rated_s_col[row] = get_element_float(idx, sync_machine, 'RotatingMachine.ratedS')
+
+    total_capacity = float(np.sum(max_p_col)) if np is not None else sum(max_p_col)
+
+    out.append(f"\nTotal Generation Capacity: {total_capacity} MW\n")
+    out.append(f"{'Unit':<25} {'Max P (MW)':<12} {'Nominal P':<12} {'Power Factor':<12} {'Rated S (MVA)':<15}")
+    out.append("-" * 80)
 
-def analyze_question_2(root):
+    for row in range(n):
+        pf = pf_col[row]
+        rated_s = rated_s_col[row]
+        out.append(f"{names[row]:<25} {max_p_col[row]:<12.1f} {nominal_p_col[row]:<12.1f} "
+              f"{'N/A' if pf is None else f'{pf:.2f}':<12} {'N/A' if rated_s is None else f'{rated_s:.1f}':<15}")
+
+def analyze_question_2(idx, out):
     """Question 2: NL-G1 regulation control"""
-    print("\n" + "="*80)
-    print("2. NL-G1 REGULATION CONTROL")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("2. NL-G1 REGULATION CONTROL")
+    out.append("="*80)
     
-    # Find NL-G1 SynchronousMachine
-    for sync_machine in root.findall('.//cim:SynchronousMachine', NAMESPACES):
-        name = get_element_text(sync_machine, 'IdentifiedObject.name')
-        
-        if name == "NL-G1":
-            mrid = get_element_text(sync_machine, 'IdentifiedObject.mRID')
-            print(f"\n✓ Generator found: {name}")
-            print(f"  mRID: {mrid}")
-            
-            # Find RegulatingControl
-            reg_control_ref = get_element_resource(sync_machine, 'RegulatingCondEq.RegulatingControl')
-            
-            if reg_control_ref:
-                reg_control_id = reg_control_ref.split('#_')[-1]
-                
-                # RegulatingControl elementini bul
-                for reg_control in root.findall('.//cim:RegulatingControl', NAMESPACES):
-                    rc_mrid = get_element_text(reg_control, 'IdentifiedObject.mRID')
-                    
-                    if rc_mrid == reg_control_id:
-                        mode_resource = get_element_resource(reg_control, 'RegulatingControl.mode')
-                        mode = mode_resource.split('#')[-1] if mode_resource else 'Unknown'
-                        
-                        print(f"\n  Regulation Mode: {mode}")
-                        
-                        print("\n" + "-"*80)
-                        print("EXPLANATION:")
-                        print("-"*80)
-                        print("✓ Control Type: VOLTAGE CONTROL")
-                        print("  - Generator maintains the set voltage setpoint")
-                        print("  - Automatically adjusts reactive power (Q) output")
-                        print("  - Helps maintain grid voltage stability")
-                        
-                        print("\nOther Regulation Modes:")
-                        print("  1. Reactive Power (Q) - Direct Q control")
-                        print("  2. Power Factor (PF) - Fixed PF control")
-                        print("  3. Fixed - No automatic regulation")
-                        print("  4. Off - No regulation provided")
-                        break
-            else:
-                print("\n  ⚠ RegulatingControl not found")
-            break
+    # NL-G1 comes straight from the name index - no machine scan
+    name = "NL-G1"
+    sync_machine = idx['names_by_type']['SynchronousMachine'].get(name)
+
+    if sync_machine is not None:
+        mrid = get_element_text(sync_machine, 'IdentifiedObject.mRID')
+        out.append(f"\n✓ Generator found: {name}")
+        out.append(f"  mRID: {mrid}")
+
+        # Resolve the RegulatingControl reference directly
+        reg_control_ref = get_element_resource(sync_machine, 'RegulatingCondEq.RegulatingControl')
+        reg_control = resolve(idx, reg_control_ref)
+
+        if reg_control is not None:
+            mode_resource = get_element_resource(reg_control, 'RegulatingControl.mode')
+            mode = suffix(mode_resource, '#') if mode_resource else 'Unknown'
+
+            out.append(f"\n  Regulation Mode: {mode}")
+
+            out.append("\n" + "-"*80)
+            out.append("EXPLANATION:")
+            out.append("-"*80)
+            out.append("✓ Control Type: VOLTAGE CONTROL")
+            out.append("  - Generator maintains the set voltage setpoint")
+            out.append("  - Automatically adjusts reactive power (Q) output")
+            out.append("  - Helps maintain grid voltage stability")
+
+            out.append("\nOther Regulation Modes:")
+            out.append("  1. Reactive Power (Q) - Direct Q control")
+            out.append("  2. Power Factor (PF) - Fixed PF control")
+            out.append("  3. Fixed - No automatic regulation")
+            out.append("  4. Off - No regulation provided")
+        else:
+            out.append("\n  ⚠ RegulatingControl not found")
 
-def analyze_question_3(root):
+def analyze_question_3(idx, out):
     """Question 3: Transformer winding voltages"""
-    print("\n" + "="*80)
-    print("3. TRANSFORMER NL_TR2_2 WINDING VOLTAGES")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("3. TRANSFORMER NL_TR2_2 WINDING VOLTAGES")
+    out.append("="*80)
     
     transformer_id = "2184f365-8cd5-4b5d-8a28-9d68603bb6a4"
-    
-    # Find PowerTransformer
-    for transformer in root.findall('.//cim:PowerTransformer', NAMESPACES):
-        mrid = get_element_text(transformer, 'IdentifiedObject.mRID')
+
+    # The transformer comes straight from the mRID index - no scan
+    transformer = idx['by_type']['PowerTransformer'].get(transformer_id)
+
+    if transformer is not None:
+        name = get_element_text(transformer, 'IdentifiedObject.name')
+        out.append(f"\nTransformer: {name}")
+        out.append(f"ID: {transformer_id}")
+        
+        out.append(f"\n{'Winding':<8} {'End #':<8} {'Rated U (kV)':<15} {'Rated S (MVA)':<15} {'Connection':<12}")
+        out.append("-" * 80)
+        
+        # Winding ends come straight from the reverse index
+        windings = []
+        for tf_end in idx['ends_by_transformer'].get(transformer_id, []):
+            end_num = get_element_text(tf_end, 'TransformerEnd.endNumber')
+            connection = get_element_resource(tf_end, 'PowerTransformerEnd.connectionKind')
+
+            connection_type = suffix(connection, '#') if connection else 'N/A'
+
+            windings.append({
+                'end': int(end_num),
+                'u': get_element_float(idx, tf_end, 'PowerTransformerEnd.ratedU'),
+                's': get_element_float(idx, tf_end, 'PowerTransformerEnd.ratedS'),
+                'conn': connection_type
+            })
         
-        if mrid == transformer_id:
-            name = get_element_text(transformer, 'IdentifiedObject.name')
-            print(f"\nTransformer: {name}")
-            print(f"ID: {transformer_id}")
-            
-            print(f"\n{'Winding':<8} {'End #':<8} {'Rated U (kV)':<15} {'Rated S (MVA)':<15} {'Connection':<12}")
-            print("-" * 80)
-            
-            # Find PowerTransformerEnds
-            windings = []
-            for tf_end in root.findall('.//cim:PowerTransformerEnd', NAMESPACES):
-                tf_ref = get_element_resource(tf_end, 'PowerTransformerEnd.PowerTransformer')
-                
-                if tf_ref and transformer_id in tf_ref:
-                    end_num = get_element_text(tf_end, 'TransformerEnd.endNumber')
-                    rated_u = get_element_text(tf_end, 'PowerTransformerEnd.ratedU')
-                    rated_s = get_element_text(tf_end, 'PowerTransformerEnd.ratedS')
-                    connection = get_element_resource(tf_end, 'PowerTransformerEnd.connectionKind')
-                    
-                    connection_type = connection.split('#')[-1] if connection else 'N/A'
-                    
-                    windings.append({
-                        'end': int(end_num),
-                        'u': float(rated_u),
-                        's': float(rated_s),
-                        'conn': connection_type
-                    })
-            
-            windings.sort(key=lambda x: x['end'])
-            
-            for w in windings:
-                side = "YG" if w['u'] > 100 else "AG"
-                print(f"{side:<8} {w['end']:<8} {w['u']:<15.2f} {w['s']:<15.1f} {w['conn']:<12}")
-            
-            if len(windings) >= 2:
-                print("\n" + "-"*80)
-                print("TRANSFORMER ANALYSIS:")
-                print("-"*80)
-                ratio = windings[0]['u'] / windings[1]['u']
-                print(f"✓ Voltage Ratio: {windings[0]['u']:.1f}/{windings[1]['u']:.2f} = {ratio:.2f}:1")
-                print(f"✓ Type: STEP-DOWN TRANSFORMER")
-                print(f"✓ Function: Conversion from transmission to distribution level")
-                print(f"✓ Power: {windings[0]['s']:.0f} MVA")
-            break
-
-def analyze_question_4(root):
+        windings.sort(key=lambda x: x['end'])
+        
+        for w in windings:
+            side = "YG" if w['u'] > 100 else "AG"
+            out.append(f"{side:<8} {w['end']:<8} {w['u']:<15.2f} {w['s']:<15.1f} {w['conn']:<12}")
+        
+        if len(windings) >= 2:
+            out.append("\n" + "-"*80)
+            out.append("TRANSFORMER ANALYSIS:")
+            out.append("-"*80)
+            ratio = windings[0]['u'] / windings[1]['u']
+            out.append(f"✓ Voltage Ratio: {windings[0]['u']:.1f}/{windings[1]['u']:.2f} = {ratio:.2f}:1")
+            out.append(f"✓ Type: STEP-DOWN TRANSFORMER")
+            out.append(f"✓ Function: Conversion from transmission to distribution level")
+            out.append(f"✓ Power: {windings[0]['s']:.0f} MVA")
+
+def analyze_question_4(idx, out):
     """Question 4: Line limits"""
-    print("\n" + "="*80)
-    print("4. LINE SEGMENT NL-Line_5 LIMITS")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("4. LINE SEGMENT NL-Line_5 LIMITS")
+    out.append("="*80)
     
     line_id = "e8acf6b6-99cb-45ad-b8dc-16c7866a4ddc"
-    
-    # Find ACLineSegment
-    for line in root.findall('.//cim:ACLineSegment', NAMESPACES):
-        mrid = get_element_text(line, 'IdentifiedObject.mRID')
+
+    # The line segment comes straight from the mRID index - no scan
+    line = idx['by_type']['ACLineSegment'].get(line_id)
+
+    if line is not None:
+        name = get_element_text(line, 'IdentifiedObject.name')
+        out.append(f"\nLine: {name}")
+        out.append(f"ID: {line_id}")
         
-        if mrid == line_id:
-            name = get_element_text(line, 'IdentifiedObject.name')
-            print(f"\nLine: {name}")
-            print(f"ID: {line_id}")
-            
-            # Find Terminals
-            terminals = []
-            for terminal in root.findall('.//cim:Terminal', NAMESPACES):
-                equip_ref = get_element_resource(terminal, 'Terminal.ConductingEquipment')
-                if equip_ref and line_id in equip_ref:
-                    term_mrid = get_element_text(terminal, 'IdentifiedObject.mRID')
-                    seq_num = get_element_text(terminal, 'ACDCTerminal.sequenceNumber')
-                    terminals.append({'mrid': term_mrid, 'seq': seq_num})
-            
-            print(f"\n{'Port':<8} {'Limit Type':<12} {'Value (A)':<12} {'Duration':<15}")
-            print("-" * 80)
-            
-            # Find limit sets for each terminal
-            for term in terminals:
-                for limit_set in root.findall('.//cim:OperationalLimitSet', NAMESPACES):
-                    term_ref = get_element_resource(limit_set, 'OperationalLimitSet.Terminal')
-                    
-                    if term_ref and term['mrid'] in term_ref:
-                        limit_set_mrid = get_element_text(limit_set, 'IdentifiedObject.mRID')
-                        
-                        # CurrentLimit'leri bul
-                        for current_limit in root.findall('.//cim:CurrentLimit', NAMESPACES):
-                            ls_ref = get_element_resource(current_limit, 'OperationalLimit.OperationalLimitSet')
-                            
-                            if ls_ref and limit_set_mrid in ls_ref:
-                                limit_value = get_element_text(current_limit, 'CurrentLimit.normalValue')
-                                limit_type_ref = get_element_resource(current_limit, 'OperationalLimit.OperationalLimitType')
-                                
-                                if limit_type_ref:
-                                    limit_type_id = limit_type_ref.split('#_')[-1]
-                                    
-                                    # OperationalLimitType'ı bul
-                                    for limit_type in root.findall('.//cim:OperationalLimitType', NAMESPACES):
-                                        lt_mrid = get_element_text(limit_type, 'IdentifiedObject.mRID')
-                                        
-                                        if lt_mrid == limit_type_id:
-                                            lt_name = get_element_text(limit_type, 'IdentifiedObject.name')
-                                            duration = get_element_text(limit_type, 'OperationalLimitType.acceptableDuration')
-                                            is_infinite = get_element_text(limit_type, 'OperationalLimitType.isInfiniteDuration')
-                                            
-                                            duration_str = "Permanent" if is_infinite == "true" else f"{duration}s" if duration else "N/A"
-                                            
-                                            print(f"{term['seq']:<8} {lt_name:<12} {limit_value:<12} {duration_str:<15}")
-                                            break
-            
-            print("\n" + "-"*80)
-            print("LIMIT TYPES EXPLANATION:")
-            print("-"*80)
-            print("PATL vs TATL Difference:")
-            print("  • PATL (Permanent Allowable Transmission Limit):")
-            print("    - Continuous operation - can operate indefinitely")
-            print("    - Based on normal cooling conditions")
-            print("    - Conservative value for long-term operation")
-            print("\n  • TATL (Temporary Allowable Transmission Limit):")
-            print("    - Short-term emergency rating value")
-            print("    - Limited duration (e.g.: 600s = 10 minutes)")
-            print("    - Used during faults or maintenance")
-            print("    - Higher than PATL due to thermal time constants")
-            
-            print("\nOther Limit Types in Grid:")
-            print("  1. Voltage Limits (high/low)")
-            print("  2. Apparent Power Limits (MVA)")
-            print("  3. Active Power Limits (MW)")
-            print("  4. Temperature Limits")
-            print("  5. Angle Limits (for phase shifters)")
-            break
-
-def analyze_question_5(root):
+        # Terminals come straight from the reverse index
+        terminals = []
+        for terminal in idx['terminals_by_equipment'].get(line_id, []):
+            term_mrid = get_element_text(terminal, 'IdentifiedObject.mRID')
+            seq_num = get_element_text(terminal, 'ACDCTerminal.sequenceNumber')
+            terminals.append({'mrid': term_mrid, 'seq': seq_num})
+
+        out.append(f"\n{'Port':<8} {'Limit Type':<12} {'Value (A)':<12} {'Duration':<15}")
+        out.append("-" * 80)
+
+        # Index joins: terminal -> limit sets -> current limits -> limit type
+        for term in terminals:
+            for limit_set in idx['sets_by_terminal'].get(term['mrid'], []):
+                limit_set_mrid = get_element_text(limit_set, 'IdentifiedObject.mRID')
+
+                for current_limit in idx['limits_by_set'].get(limit_set_mrid, []):
+                    limit_value = get_element_text(current_limit, 'CurrentLimit.normalValue')
+                    limit_type_ref = get_element_resource(current_limit, 'OperationalLimit.OperationalLimitType')
+
+                    if limit_type_ref:
+                        limit_type = resolve(idx, limit_type_ref)
+
+                        if limit_type is not None:
+                            lt_name = get_element_text(limit_type, 'IdentifiedObject.name')
+                            duration = get_element_text(limit_type, 'OperationalLimitType.acceptableDuration')
+                            is_infinite = get_element_text(limit_type, 'OperationalLimitType.isInfiniteDuration')
+
+                            duration_str = "Permanent" if is_infinite == "true" else f"{duration}s" if duration else "N/A"
+
+                            out.append(f"{term['seq']:<8} {lt_name:<12} {limit_value:<12} {duration_str:<15}")
+        
+        out.append("\n" + "-"*80)
+        out.append("LIMIT TYPES EXPLANATION:")
+        out.append("-"*80)
+        out.append("PATL vs TATL Difference:")
+        out.append("  • PATL (Permanent Allowable Transmission Limit):")
+        out.append("    - Continuous operation - can operate indefinitely")
+        out.append("    - Based on normal cooling conditions")
+        out.append("    - Conservative value for long-term operation")
+        out.append("\n  • TATL (Temporary Allowable Transmission Limit):")
+        out.append("    - Short-term emergency rating value")
+        out.append("    - Limited duration (e.g.: 600s = 10 minutes)")
+        out.append("    - Used during faults or maintenance")
+        out.append("    - Higher than PATL due to thermal time constants")
+        
+        out.append("\nOther Limit Types in Grid:")
+        out.append("  1. Voltage Limits (high/low)")
+        out.append("  2. Apparent Power Limits (MVA)")
+        out.append("  3. Active Power Limits (MW)")
+        out.append("  4. Temperature Limits")
+        out.append("  5. Angle Limits (for phase shifters)")
+
+def analyze_question_5(idx, out):
     """Question 5: Slack generator"""
-    print("\n" + "="*80)
-    print("5. SLACK GENERATOR IDENTIFICATION")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("5. SLACK GENERATOR IDENTIFICATION")
+    out.append("="*80)
     
-    print("\nAnalysis of Generator Control Sources:")
-    print("-" * 80)
+    out.append("\nAnalysis of Generator Control Sources:")
+    out.append("-" * 80)
     
     generators = []
     slack_found = False
     
-    for gen_unit in root.findall('.//cim:GeneratingUnit', NAMESPACES):
+    for gen_unit in idx['elements_by_type']['GeneratingUnit']:
         name = get_element_text(gen_unit, 'IdentifiedObject.name')
         control_source = get_element_resource(gen_unit, 'GeneratingUnit.genControlSource')
         max_p = get_element_text(gen_unit, 'GeneratingUnit.maxOperatingP')
         
-        control_str = control_source.split('#')[-1] if control_source else "Not specified"
-        
+        control_str = suffix(control_source, '#') if control_source else "Not specified"
+        # max_p stays the raw text for display; the pre-parsed float is
+        # only needed for the largest-unit comparison
+        max_p_val = get_element_float(idx, gen_unit, 'GeneratingUnit.maxOperatingP')
+
         generators.append({
             'name': name,
             'control': control_str,
-            'max_p': float(max_p) if max_p else 0
+            'max_p': max_p_val if max_p_val is not None else 0
         })
         
         if 'onAGC' in control_str or 'slack' in control_str.lower():
             slack_found = True
-            print(f"✓ SLACK: {name:<25} Control: {control_str:<20} Max P: {max_p} MW")
+            out.append(f"✓ SLACK: {name:<25} Control: {control_str:<20} Max P: {max_p} MW")
         else:
-            print(f"  {name:<25} Control: {control_str:<20} Max P: {max_p} MW")
+            out.append(f"  {name:<25} Control: {control_str:<20} Max P: {max_p} MW")
     
     if not slack_found:
-        print("\n⚠ WARNING: No explicit slack generator found!")
-        print("  All generators set to 'offAGC'")
+        out.append("\n⚠ WARNING: No explicit slack generator found!")
+        out.append("  All generators set to 'offAGC'")
         
         if generators:
             largest = max(generators, key=lambda x: x['max_p'])
-            print(f"\n  Recommendation: {largest['name']} (largest, {largest['max_p']} MW) can be slack")
-    
-    print("\n" + "-"*80)
-    print("WHY IS SLACK NODE REQUIRED:")
-    print("-"*80)
-    print("1. Mathematical Requirement:")
-    print("   - Power system: n buses, but only (n-1) independent equations")
-    print("   - A reference bus needed to solve the system")
-    
-    print("\n2. Reference Angle:")
-    print("   - Slack bus angle is 0° (reference)")
-    print("   - All other bus angles are measured relative to slack")
-    
-    print("\n3. Power Balance:")
-    print("   - Absorbs power mismatches (generation - load - losses)")
-    print("   - Ensures system power balance")
-    
-    print("\n4. Frequency Reference:")
-    print("   - Maintains system frequency in steady-state analysis")
-    print("   - Represents infinite bus in dynamic analysis")
-    
-    print("\n5. Load Flow Convergence:")
-    print("   - Provides unique solution")
-    print("   - Prevents numerical singularity")
+            out.append(f"\n  Recommendation: {largest['name']} (largest, {largest['max_p']} MW) can be slack")
+    
+    out.append("\n" + "-"*80)
+    out.append("WHY IS SLACK NODE REQUIRED:")
+    out.append("-"*80)
+    out.append("1. Mathematical Requirement:")
+    out.append("   - Power system: n buses, but only (n-1) independent equations")
+    out.append("   - A reference bus needed to solve the system")
+    
+    out.append("\n2. Reference Angle:")
+    out.append("   - Slack bus angle is 0° (reference)")
+    out.append("   - All other bus angles are measured relative to slack")
+    
+    out.append("\n3. Power Balance:")
+    out.append("   - Absorbs power mismatches (generation - load - losses)")
+    out.append("   - Ensures system power balance")
+    
+    out.append("\n4. Frequency Reference:")
+    out.append("   - Maintains system frequency in steady-state analysis")
+    out.append("   - Represents infinite bus in dynamic analysis")
+    
+    out.append("\n5. Load Flow Convergence:")
+    out.append("   - Provides unique solution")
+    out.append("   - Prevents numerical singularity")
 
-def analyze_question_6(root, file_path):
+def analyze_question_6(idx, out):
     """Question 6: Model errors"""
-    print("\n" + "="*80)
-    print("6. MODEL ERRORS AND ISSUES")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("6. MODEL ERRORS AND ISSUES")
+    out.append("="*80)
     
     errors = []
     warnings = []
     
     # Error 1: Duplicate mRIDs
-    print("\n[1] Checking duplicate mRIDs...")
-    mrids = defaultdict(list)
-    
-    for element in root.iter():
-        for child in element:
-            if 'mRID' in child.tag:
-                if child.text:
-                    mrids[child.text].append(element.tag.split('}')[-1])
-    
-    for mrid, elements in mrids.items():
+    out.append("\n[1] Checking duplicate mRIDs...")
+    # The owner map was already collected while indexing - no tree walk here
+    for mrid, elements in idx['mrid_owners'].items():
         if len(elements) > 1:
             errors.append(f"DUPLICATE mRID: {mrid}")
             errors.append(f"  Used in {len(elements)} elements: {set(elements)}")
     
     # Error 2: PowerTransformerEnd duplicate
-    print("[2] Checking PowerTransformerEnd...")
+    out.append("[2] Checking PowerTransformerEnd...")
     tf_end_ids = defaultdict(list)
     
-    for tf_end in root.findall('.//cim:PowerTransformerEnd', NAMESPACES):
+    for tf_end in idx['elements_by_type']['PowerTransformerEnd']:
         mrid = get_element_text(tf_end, 'IdentifiedObject.mRID')
         name = get_element_text(tf_end, 'IdentifiedObject.name')
         if mrid:
@@ -385,114 +594,118 @@ def analyze_question_6(root, file_path):
             errors.append(f"  Found in {len(names)} windings: {names}")
     
     # Error 3: TATL < PATL check
-    print("[3] Checking operational limit logic...")
-    
-    # Tüm limit setlerini bul
-    for limit_set in root.findall('.//cim:OperationalLimitSet', NAMESPACES):
-        ls_mrid = get_element_text(limit_set, 'IdentifiedObject.mRID')
-        patl_value = None
-        tatl_value = None
-        
-        for current_limit in root.findall('.//cim:CurrentLimit', NAMESPACES):
-            ls_ref = get_element_resource(current_limit, 'OperationalLimit.OperationalLimitSet')
-            
-            if ls_ref and ls_mrid in ls_ref:
-                limit_value = get_element_text(current_limit, 'CurrentLimit.normalValue')
-                limit_type_ref = get_element_resource(current_limit, 'OperationalLimit.OperationalLimitType')
-                
-                if limit_type_ref:
-                    lt_id = limit_type_ref.split('#_')[-1]
-                    
-                    for limit_type in root.findall('.//cim:OperationalLimitType', NAMESPACES):
-                        lt_mrid = get_element_text(limit_type, 'IdentifiedObject.mRID')
-                        lt_name = get_element_text(limit_type, 'IdentifiedObject.name')
-                        
-                        if lt_mrid == lt_id:
-                            if 'PATL' in lt_name:
-                                patl_value = float(limit_value) if limit_value else None
-                            elif 'TATL' in lt_name:
-                                tatl_value = float(limit_value) if limit_value else None
-                            break
-        
-        if patl_value and tatl_value and tatl_value < patl_value:
-            errors.append(f"ILLOGICAL LIMIT: TATL ({tatl_value}A) < PATL ({patl_value}A)")
-            errors.append(f"  Temporary limit should be HIGHER than permanent limit!")
-    
+    out.append("[3] Checking operational limit logic...")
+
+    # Extract the limits into parallel arrays aligned by limit-set index,
+    # then run the comparison as one vectorized kernel instead of comparing
+    # inside the extraction loop (plain Python when numpy is not installed)
+    # Iterate the limits-per-set index directly: no OperationalLimitSet
+    # scan and no mRID extraction per set, just the grouped limits
+    patl_values = []
+    tatl_values = []
+    for ls_mrid, limits in idx['limits_by_set'].items():
+        patl_value = 0.0
+        tatl_value = 0.0
+
+        for current_limit in limits:
+            limit_value = get_element_float(idx, current_limit, 'CurrentLimit.normalValue')
+            limit_type_ref = get_element_resource(current_limit, 'OperationalLimit.OperationalLimitType')
+
+            if limit_type_ref:
+                limit_type = resolve(idx, limit_type_ref)
+
+                if limit_type is not None:
+                    lt_name = get_element_text(limit_type, 'IdentifiedObject.name')
+                    if 'PATL' in lt_name:
+                        patl_value = limit_value if limit_value is not None else 0.0
+                    elif 'TATL' in lt_name:
+                        tatl_value = limit_value if limit_value is not None else 0.0
+
+        patl_values.append(patl_value)
+        tatl_values.append(tatl_value)
+
+    if np is not None:
+        patl_arr = np.asarray(patl_values)
+        tatl_arr = np.asarray(tatl_values)
+        bad = np.nonzero((patl_arr > 0) & (tatl_arr > 0) & (tatl_arr < patl_arr))[0]
+    else:
+        bad = [i for i, (p, t) in enumerate(zip(patl_values, tatl_values))
+               if p > 0 and t > 0 and t < p]
+
+    for i in bad:
+        errors.append(f"ILLOGICAL LIMIT: TATL ({tatl_values[i]}A) < PATL ({patl_values[i]}A)")
+        errors.append(f"  Temporary limit should be HIGHER than permanent limit!")
+
     # Error 4: Voltage level consistency
-    print("[4] Checking voltage level consistency...")
-    
-    for vl in root.findall('.//cim:VoltageLevel', NAMESPACES):
+    out.append("[4] Checking voltage level consistency...")
+
+    # Same pattern: gather the numeric pairs first, compare as one kernel
+    vl_names = []
+    vl_nums = []
+    bv_nums = []
+    for vl in idx['elements_by_type']['VoltageLevel']:
         vl_name = get_element_text(vl, 'IdentifiedObject.name')
         base_v_ref = get_element_resource(vl, 'VoltageLevel.BaseVoltage')
-        
+
         if base_v_ref and vl_name:
-            bv_id = base_v_ref.split('#_')[-1]
-            
-            for base_v in root.findall('.//cim:BaseVoltage', NAMESPACES):
-                bv_mrid = get_element_text(base_v, 'IdentifiedObject.mRID')
-                
-                if bv_mrid == bv_id:
-                    nominal_v = get_element_text(base_v, 'BaseVoltage.nominalVoltage')
-                    
-                    if nominal_v:
-                        try:
-                            vl_num = float(vl_name)
-                            bv_num = float(nominal_v)
-                            
-                            if abs(vl_num - bv_num) > 1.0:
-                                warnings.append(f"VOLTAGE MISMATCH: VoltageLevel '{vl_name}' kV vs BaseVoltage {bv_num} kV")
-                        except ValueError:
-                            pass
-                    break
+            base_v = resolve(idx, base_v_ref)
+
+            if base_v is not None:
+                bv_num = get_element_float(idx, base_v, 'BaseVoltage.nominalVoltage')
+
+                if bv_num is not None:
+                    try:
+                        vl_num = float(vl_name)
+                    except ValueError:
+                        continue
+                    vl_names.append(vl_name)
+                    vl_nums.append(vl_num)
+                    bv_nums.append(bv_num)
+
+    if np is not None:
+        mismatched = np.nonzero(np.abs(np.asarray(vl_nums) - np.asarray(bv_nums)) > 1.0)[0]
+    else:
+        mismatched = [i for i, (v, b) in enumerate(zip(vl_nums, bv_nums))
+                      if abs(v - b) > 1.0]
+
+    for i in mismatched:
+        warnings.append(f"VOLTAGE MISMATCH: VoltageLevel '{vl_names[i]}' kV vs BaseVoltage {bv_nums[i]} kV")
     
     # Error 5: Zero impedance
-    print("[5] Checking equipment impedances...")
+    out.append("[5] Checking equipment impedances...")
     
-    for eq_inj in root.findall('.//cim:EquivalentInjection', NAMESPACES):
+    for eq_inj in idx['elements_by_type']['EquivalentInjection']:
         name = get_element_text(eq_inj, 'IdentifiedObject.name')
-        r = get_element_text(eq_inj, 'EquivalentInjection.r')
-        x = get_element_text(eq_inj, 'EquivalentInjection.x')
-        
-        if r and x and float(r) == 0 and float(x) == 0:
+        r = get_element_float(idx, eq_inj, 'EquivalentInjection.r')
+        x = get_element_float(idx, eq_inj, 'EquivalentInjection.x')
+
+        if r is not None and x is not None and r == 0 and x == 0:
             warnings.append(f"ZERO IMPEDANCE: {name} has r=0, x=0 values")
     
     # Error 6: XML structure errors
-    print("[6] Checking XML structure...")
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            xml_content = f.read()
-        
-        if '<md:FullModel' in xml_content and '</md:FullModel>' not in xml_content:
-            errors.append("XML STRUCTURE ERROR: Missing closing tag </md:FullModel>")
-        
-        if 'bf2a4896-2e92-465b-b5f9-b033993a318"' in xml_content:
-            errors.append("INCOMPLETE mRID: bf2a4896-2e92-465b-b5f9-b033993a318 (should end with 31c8)")
-        
-        if '<cim:IdentifiedObject.lname>' in xml_content:
-            errors.append("XML TYPO ERROR: Found '<lname>' tag, should be '<name>'")
-    
-    except Exception as e:
-        warnings.append(f"XML structure could not be checked: {e}")
+    out.append("[6] Checking XML structure...")
+    # Collected during the iterparse/indexing pass - no second file read.
+    # Well-formedness (e.g. an unclosed md:FullModel) already fails the parse.
+    errors.extend(idx['structure_issues'])
     
     # Print results
-    print("\n" + "="*80)
-    print("ERROR SUMMARY")
-    print("="*80)
+    out.append("\n" + "="*80)
+    out.append("ERROR SUMMARY")
+    out.append("="*80)
     
     if errors:
-        print(f"\n🔴 CRITICAL ERRORS: {len(errors)}")
+        out.append(f"\n🔴 CRITICAL ERRORS: {len(errors)}")
         for i, error in enumerate(errors, 1):
-            print(f"\n{i}. {error}")
+            out.append(f"\n{i}. {error}")
     else:
-        print("\n✓ No critical errors found")
+        out.append("\n✓ No critical errors found")
     
     if warnings:
-        print(f"\n🟡 WARNINGS: {len(warnings)}")
+        out.append(f"\n🟡 WARNINGS: {len(warnings)}")
         for i, warning in enumerate(warnings, 1):
-            print(f"\n{i}. {warning}")
+            out.append(f"\n{i}. {warning}")
     else:
-        print("\n✓ No warnings")
+        out.append("\n✓ No warnings")
 
 def main():
     """Main function"""
@@ -507,25 +720,44 @@ def main():
     # Or get from user:
     # file_path = input("Enter XML file path: ")
     
-    # Parse file
-    tree, root = parse_cgmes_file(file_path)
-    if root is None:
+    # Parse file (single streaming pass; only the object types the analyses
+    # use are retained, everything else is cleared as it completes)
+    buckets, mrid_owners, structure_issues = parse_cgmes_file(file_path)
+    if buckets is None:
         return
-    
+
+    # Build the shared lookup index once; all analyses reuse it
+    idx = build_index(buckets, mrid_owners, structure_issues)
+
+    # The analyses only read the shared index, so they run concurrently on
+    # a thread pool, each into its own line buffer; the buffers are joined
+    # in question order and written in one go (thousands of small print()
+    # calls, each re-encoded through the UTF-8 wrapper on Windows, become
+    # a single stdout write). With lxml the find/iter calls release the
+    # GIL, so the DOM-heavy passes genuinely overlap
+    analyses = (
+        analyze_question_1, analyze_question_2, analyze_question_3,
+        analyze_question_4, analyze_question_5, analyze_question_6,
+    )
+    buffers = [[] for _ in analyses]
     try:
-        # Analyze all questions
-        analyze_question_1(root)
-        analyze_question_2(root)
-        analyze_question_3(root)
-        analyze_question_4(root)
-        analyze_question_5(root)
-        analyze_question_6(root, file_path)
-        
-        print("\n" + "="*80)
-        print(" "*30 + "ANALYSIS COMPLETED")
-        print("="*80)
-        
+        with ThreadPoolExecutor(max_workers=len(analyses)) as pool:
+            futures = [pool.submit(fn, idx, buf)
+                       for fn, buf in zip(analyses, buffers)]
+            for future in futures:
+                future.result()
+
+        out = [line for buf in buffers for line in buf]
+        out.append("\n" + "="*80)
+        out.append(" "*30 + "ANALYSIS COMPLETED")
+        out.append("="*80)
+
+        sys.stdout.write('\n'.join(out) + '\n')
     except Exception as e:
+        # Flush whatever the analyses produced before the failure, then
+        # the error
+        out = [line for buf in buffers for line in buf]
+        sys.stdout.write('\n'.join(out) + '\n')
         print(f"\n✗ Error during analysis: {e}")
         import traceback
         traceback.print_exc()